@@ -11,11 +11,99 @@ A comprehensive OOP-based application demonstrating:
 Author: Muhammad Farel Alfathir - Final Assignment (Advanced Programming)
 """
 
+import bisect
+import enum
 import json
 import os
+import threading
 import tkinter as tk
+import tkinter.font as tkfont
+from concurrent.futures import Future, ThreadPoolExecutor
+from operator import attrgetter
 from tkinter import ttk, messagebox
-from typing import List, Optional, Dict
+from typing import (
+    Any,
+    Callable,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Dict,
+    Set,
+    Tuple,
+)
+
+# orjson is an optional, much faster JSON backend. The application works
+# with the standard library alone; orjson is used automatically if installed.
+try:
+    import orjson
+except ImportError:  # pragma: no cover - depends on the environment
+    orjson = None
+
+# ijson (optional) parses large data files incrementally, so the whole
+# document never has to be held in memory at once.
+try:
+    import ijson
+except ImportError:  # pragma: no cover - depends on the environment
+    ijson = None
+
+
+# Sort keys for StudentManager. attrgetter extracts the cached lower-case
+# key in C, avoiding a Python-level lambda call (and a new string) per
+# element; building them once also avoids re-creating them on every sort.
+_NAME_SORT_KEY = attrgetter("_name_lc")
+_ID_SORT_KEY = attrgetter("_id_lc")
+
+# A student's (name, student ID, major) table row, read from the slots in a
+# single C-level call
+_ROW_FIELDS = attrgetter("_Person__name", "_Person__id", "_Student__major")
+
+# Treeview stripe tags, indexed by (row number & 1) for 1-based row numbers
+ROW_TAGS = ("evenrow", "oddrow")
+
+
+# ============================================================================
+# JSON BACKEND HELPERS
+# ============================================================================
+def _dumps(data: Any, pretty: bool = False) -> bytes:
+    """
+    Serialize data to UTF-8 encoded JSON bytes.
+
+    Uses orjson when available and falls back to the standard library.
+
+    Args:
+        data: The object to serialize.
+        pretty: Indent the output for human reading. The default compact
+            form is smaller and faster to produce.
+    """
+    if orjson is not None:
+        if pretty:
+            return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+        return orjson.dumps(data)
+    if pretty:
+        return json.dumps(data, indent=4, ensure_ascii=False).encode("utf-8")
+    return json.dumps(data, ensure_ascii=False, separators=(",", ":")).encode(
+        "utf-8"
+    )
+
+
+def _loads(buf: bytes) -> Any:
+    """
+    Parse UTF-8 encoded JSON bytes into Python objects.
+    """
+    if orjson is not None:
+        return orjson.loads(buf)
+    return json.loads(buf)
+
+
+# ============================================================================
+# SEARCH HELPERS
+# ============================================================================
+def _trigrams(text: str) -> Set[str]:
+    """
+    Return the set of 3-character substrings of text.
+    """
+    return {text[i : i + 3] for i in range(len(text) - 2)}
 
 
 # ============================================================================
@@ -31,6 +119,27 @@ class ValidationError(Exception):
     """
 
 
+# ============================================================================
+# RESULT TYPE FOR ADD OPERATIONS
+# ============================================================================
+class AddResult(enum.Enum):
+    """
+    Outcome of StudentManager.add_student.
+
+    Lets callers tell a duplicate ID apart from invalid input without a
+    second lookup. Only OK is truthy, so simple success checks such as
+    ``if manager.add_student(...)`` keep working.
+    """
+
+    OK = "ok"
+    DUPLICATE = "duplicate"
+    INVALID = "invalid"
+
+    def __bool__(self) -> bool:
+        """Return True only for a successful add."""
+        return self is AddResult.OK
+
+
 # ============================================================================
 # BASE MODEL CLASS: Person (used for INHERITANCE & POLYMORPHISM)
 # ============================================================================
@@ -44,6 +153,11 @@ class Person:
     - POLYMORPHISM: The get_details method can be overridden by subclasses.
     """
 
+    # Fixed attribute layout instead of a per-instance __dict__ (smaller
+    # objects, faster attribute access). Names starting with "__" are
+    # mangled to _Person__name / _Person__id just like the attributes.
+    __slots__ = ("__name", "__id", "_name_lc", "_id_lc", "_details_cache")
+
     def __init__(self, name: str, person_id: str) -> None:
         """
         Initialize a Person with private attributes.
@@ -55,6 +169,14 @@ class Person:
         self.__name: str = name
         self.__id: str = person_id
 
+        # Lower-cased copies, kept in sync by the setters, used as
+        # case-insensitive search and sort keys
+        self._name_lc: str = name.lower()
+        self._id_lc: str = person_id.lower()
+
+        # Memoized get_details() result, cleared by the setters
+        self._details_cache: Optional[str] = None
+
     # ---------------------------------------------------------------------
     # Getter methods
     # ---------------------------------------------------------------------
@@ -66,6 +188,14 @@ class Person:
         """Return the person's identifier."""
         return self.__id
 
+    def get_name_lc(self) -> str:
+        """Return the person's name in lower case (cached)."""
+        return self._name_lc
+
+    def get_id_lc(self) -> str:
+        """Return the person's identifier in lower case (cached)."""
+        return self._id_lc
+
     # ---------------------------------------------------------------------
     # Setter methods with validation and custom exceptions
     # ---------------------------------------------------------------------
@@ -79,6 +209,8 @@ class Person:
         if not name.strip():
             raise ValidationError("Name cannot be empty.")
         self.__name = name.strip()
+        self._name_lc = self.__name.lower()
+        self._details_cache = None
 
     def set_id(self, person_id: str) -> None:
         """
@@ -90,6 +222,8 @@ class Person:
         if not person_id.strip():
             raise ValidationError("ID cannot be empty.")
         self.__id = person_id.strip()
+        self._id_lc = self.__id.lower()
+        self._details_cache = None
 
     # ---------------------------------------------------------------------
     # POLYMORPHIC METHOD
@@ -101,7 +235,9 @@ class Person:
         This method is designed for POLYMORPHISM: subclasses such as
         Student will override this method to provide more specific details.
         """
-        return f"Person(ID: {self.__id}, Name: {self.__name})"
+        if self._details_cache is None:
+            self._details_cache = f"Person(ID: {self.__id}, Name: {self.__name})"
+        return self._details_cache
 
 
 # ============================================================================
@@ -117,6 +253,8 @@ class Student(Person):
     - POLYMORPHISM: Overrides get_details from the Person base class.
     """
 
+    __slots__ = ("__major",)
+
     def __init__(self, name: str, student_id: str, major: str) -> None:
         """
         Initialize a Student object with private attributes.
@@ -132,14 +270,10 @@ class Student(Person):
     # ========================================================================
     # ADDITIONAL GETTERS/SETTERS
     # ========================================================================
-    def get_student_id(self) -> str:
-        """
-        Convenience wrapper around base class ID getter.
-
-        Returns:
-            The student's ID (NIM).
-        """
-        return self.get_id()
+    # The student ID (NIM) is the base class ID. Aliasing the getter
+    # (instead of wrapping it) saves a Python frame on every call.
+    get_student_id = Person.get_id
+    get_student_id_lc = Person.get_id_lc
 
     def get_major(self) -> str:
         """
@@ -163,6 +297,7 @@ class Student(Person):
         if not major.strip():
             raise ValidationError("Major cannot be empty.")
         self.__major = major.strip()
+        self._details_cache = None
 
     # ---------------------------------------------------------------------
     # POLYMORPHIC METHOD OVERRIDE
@@ -173,11 +308,15 @@ class Student(Person):
 
         Demonstrates POLYMORPHISM: the same method name behaves
         differently for a Student instance than for a generic Person.
+        The string is built once and reused until a setter changes the
+        student.
         """
-        return (
-            f"Student(ID: {self.get_student_id()}, "
-            f"Name: {self.get_name()}, Major: {self.__major})"
-        )
+        if self._details_cache is None:
+            self._details_cache = (
+                f"Student(ID: {self.get_student_id()}, "
+                f"Name: {self.get_name()}, Major: {self.__major})"
+            )
+        return self._details_cache
 
     # ---------------------------------------------------------------------
     # SERIALIZATION HELPERS
@@ -200,6 +339,9 @@ class Student(Person):
         """
         Create a Student object from a dictionary.
 
+        Values are converted with str(), so a hand-edited file that stores
+        e.g. a NIM as a JSON number still loads.
+
         Args:
             data: Dictionary containing student information.
 
@@ -207,11 +349,47 @@ class Student(Person):
             A new Student instance.
         """
         return cls(
-            name=data["name"],
-            student_id=data["student_id"],
-            major=data["major"],
+            name=str(data["name"]),
+            student_id=str(data["student_id"]),
+            major=str(data["major"]),
         )
 
+    @classmethod
+    def from_dict_fast(cls, data: Dict[str, str]) -> "Student":
+        """
+        Create a Student from a trusted dictionary, bypassing __init__.
+
+        The slots are filled directly, which saves the __init__ call chain
+        per record when loading many students. Only use it for data that
+        is already clean (e.g. written by StudentManager); use from_dict
+        for anything else. Values are converted with str() as in from_dict
+        (a no-op for strings).
+
+        Args:
+            data: Dictionary containing student information.
+
+        Returns:
+            A new Student instance.
+        """
+        name = str(data["name"])
+        student_id = str(data["student_id"])
+        student = cls.__new__(cls)
+        student._Person__name = name
+        student._Person__id = student_id
+        student._name_lc = name.lower()
+        student._id_lc = student_id.lower()
+        student._details_cache = None
+        student.__major = str(data["major"])
+        return student
+
+    def as_row(self) -> Tuple[str, str, str]:
+        """
+        Return the student's (name, student ID, major) for table display.
+
+        Reads the slots directly: one call per row instead of three getters.
+        """
+        return _ROW_FIELDS(self)
+
     def __str__(self) -> str:
         """String representation of the Student object."""
         return self.get_details()
@@ -232,25 +410,85 @@ class StudentManager:
     - COMPOSITION: Contains a list of Student objects.
     - SINGLE RESPONSIBILITY: Focuses solely on student management operations.
     - DATA PERSISTENCE: Handles saving/loading data to/from JSON file.
+
+    Additions, edits and deletions are appended as single records to a
+    small JSON-Lines log next to the data file, so each costs one short
+    write instead of rewriting every student. Sorting marks the collection
+    as dirty; call flush() to write a full snapshot. The log is
+    folded back into the data file by compact() (and automatically every
+    COMPACT_EVERY entries).
+
+    The actual disk writes run on a single background thread, in order, so
+    callers (e.g. the GUI) never block on file I/O. The bytes to write are
+    produced on the caller's thread, so they always reflect a consistent
+    state of the collection.
     """
 
-    def __init__(self, data_file: str = "students_data.json") -> None:
+    # Number of log entries after which the log is folded into the data file
+    COMPACT_EVERY: int = 1000
+
+    # Maximum number of search results kept in the search cache
+    SEARCH_CACHE_SIZE: int = 64
+
+    # Data files at least this large are stream-parsed (if ijson is
+    # installed); below it a one-shot parse is faster
+    STREAM_THRESHOLD: int = 64 * 1024
+
+    # Parsed records of data files smaller than STREAM_THRESHOLD, shared by
+    # all managers, keyed by absolute file path and validated against the
+    # file's (mtime_ns, size) before being reused.
+    __records_cache: Dict[str, Tuple[Tuple[int, int], List[Dict[str, str]]]] = {}
+
+    def __init__(
+        self, data_file: str = "students_data.json", autoload: bool = True
+    ) -> None:
         """
         Initialize the StudentManager with an empty list and load existing data.
 
         Args:
             data_file: Path to the JSON file for data persistence.
+            autoload: Load the data file right away. Pass False to call
+                load_from_file() later (e.g. from a background thread).
         """
         self.__students: List[Student] = []
+        # Index of the same Student objects keyed by student ID (NIM)
+        self.__by_id: Dict[str, Student] = {}
+        # Search index: lower-case trigram of a name or ID -> students
+        self.__trigrams: Dict[str, Set[Student]] = {}
+        # Recent search results (query -> matches), cleared on any change
+        self.__search_cache: Dict[str, List[Student]] = {}
+        self.__last_query: str = ""
         self.__data_file: str = data_file
+        self.__dirty: bool = False
+
+        # Append-only log of the additions, updates and deletions made since
+        # the last full save. A data file that already ends in ".jsonl"
+        # gets a ".log" suffix instead, so the log never overwrites it.
+        log_file = os.path.splitext(data_file)[0] + ".jsonl"
+        if os.path.normcase(log_file) == os.path.normcase(data_file):
+            log_file = data_file + ".log"
+        self.__log_file: str = log_file
+        self.__log_entries: int = 0
+
+        # Single worker thread so writes reach the disk in submission order
+        self.__writer = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="student-writer"
+        )
+        self.__last_write: Optional[Future] = None
+
+        # Active sort order (set by sort_students), kept up to date by the
+        # mutators so the list never needs a full re-sort after a change
+        self.__sort_key: Optional[Callable[[Student], str]] = None
+        self.__sort_reverse: bool = False
 
         # Load existing data from file if it exists
-        self.load_from_file()
+        if autoload:
+            self.load_from_file()
 
     # ---------------------------------------------------------------------
     # CRUD OPERATIONS
     # ---------------------------------------------------------------------
-    def add_student(self, name: str, student_id: str, major: str) -> bool:
+    def add_student(self, name: str, student_id: str, major: str) -> AddResult:
         """
         Add a new student to the collection.
 
@@ -265,22 +503,33 @@ class StudentManager:
             major: Student's major.
 
         Returns:
-            True if student was added successfully, False otherwise.
+            AddResult.OK if the student was added, AddResult.DUPLICATE if
+            the ID is already taken, AddResult.INVALID for invalid input.
         """
-        if not name.strip() or not student_id.strip() or not major.strip():
-            return False
+        # Strip each field once and reuse the results below
+        name, student_id, major = name.strip(), student_id.strip(), major.strip()
+        if not name or not student_id or not major:
+            return AddResult.INVALID
 
         # Check for duplicate student ID (NIM should be unique)
-        if self._find_student_by_id(student_id.strip()) is not None:
-            return False
+        if student_id in self.__by_id:
+            return AddResult.DUPLICATE
 
         try:
-            new_student = Student(name.strip(), student_id.strip(), major.strip())
-            self.__students.append(new_student)
-            self.save_to_file()
-            return True
+            new_student = Student(name, student_id, major)
+            index = self._insert_in_order(new_student)
+            self.__by_id[student_id] = new_student
+            self._index_student(new_student)
+            self.__search_cache.clear()
+            if not self.__dirty:
+                # Log just this record; if a full save is already pending it
+                # will include the new student anyway
+                self._append_to_log(
+                    {"op": "add", "index": index, **new_student.to_dict()}
+                )
+            return AddResult.OK
         except ValidationError:
-            return False
+            return AddResult.INVALID
 
     def update_student(
         self,
@@ -306,18 +555,42 @@ class StudentManager:
             return False
 
         new_student_id_stripped = new_student_id.strip()
+        # Validate everything up front so a failed update never leaves the
+        # student (or the ID index) half-modified
+        if not new_name.strip() or not new_student_id_stripped or not new_major.strip():
+            return False
+
         # If changing ID, ensure uniqueness
         if (
             new_student_id_stripped != original_student_id
-            and self._find_student_by_id(new_student_id_stripped) is not None
+            and new_student_id_stripped in self.__by_id
         ):
             return False
 
+        # Locate the student while its sort key is still the old one
+        position = self._index_of(student) if self.__sort_key is not None else -1
+
         try:
+            self._unindex_student(student)
             student.set_name(new_name)
             student.set_id(new_student_id_stripped)
             student.set_major(new_major)
-            self.save_to_file()
+            self._index_student(student)
+            self.__search_cache.clear()
+            if new_student_id_stripped != original_student_id:
+                del self.__by_id[original_student_id]
+                self.__by_id[new_student_id_stripped] = student
+            entry: Dict[str, Any] = {
+                "op": "update",
+                "old_id": original_student_id,
+                **student.to_dict(),
+            }
+            if self.__sort_key is not None:
+                # The sort key may have changed: move the student into place
+                self.__students.pop(position)
+                entry["index"] = self._insert_in_order(student)
+            if not self.__dirty:
+                self._append_to_log(entry)
             return True
         except ValidationError:
             return False
@@ -332,10 +605,13 @@ class StudentManager:
         Returns:
             True if student was deleted, False if not found.
         """
-        student = self._find_student_by_id(student_id)
+        student = self.__by_id.pop(student_id, None)
         if student is not None:
-            self.__students.remove(student)
-            self.save_to_file()
+            self.__students.pop(self._index_of(student))
+            self._unindex_student(student)
+            self.__search_cache.clear()
+            if not self.__dirty:
+                self._append_to_log({"op": "delete", "student_id": student_id})
             return True
         return False
 
@@ -348,51 +624,136 @@ class StudentManager:
         """
         return self.__students.copy()
 
+    def get_student(self, student_id: str) -> Optional[Student]:
+        """
+        Look up a single student by ID.
+
+        Args:
+            student_id: The ID to look up.
+
+        Returns:
+            Student object if found, None otherwise.
+        """
+        return self._find_student_by_id(student_id)
+
+    def count(self) -> int:
+        """
+        Return the number of students in the collection (without copying it).
+        """
+        return len(self.__students)
+
     def search_students(self, query: str) -> List[Student]:
         """
         Search for students by name or ID.
 
-        This method demonstrates basic search/filter logic.
+        Results are cached per query until the collection changes, so
+        repeating a search (e.g. after a backspace) is a dictionary lookup.
+        A query that extends the previous one only filters the previous
+        results. Other queries of three or more characters are answered
+        from the trigram index: only students containing every trigram of
+        the query are checked, instead of every student.
 
         Args:
             query: Text to search in name or ID (case-insensitive).
 
         Returns:
-            List of matching Student objects.
+            List of matching Student objects, in collection order.
         """
         query = query.strip().lower()
         if not query:
             return self.get_all_students()
 
-        result: List[Student] = []
-        for student in self.__students:
-            if (
-                query in student.get_name().lower()
-                or query in student.get_student_id().lower()
-            ):
-                result.append(student)
-        return result
+        result = self.__search_cache.get(query)
+        if result is None:
+            previous = None
+            if self.__last_query in query:
+                previous = self.__search_cache.get(self.__last_query)
+            if previous is not None:
+                # Every match of the longer query also matched the previous one
+                result = self._matching(previous, query)
+            else:
+                result = self._search_all(query)
+
+            if len(self.__search_cache) >= self.SEARCH_CACHE_SIZE:
+                # Evict the oldest entry (dicts keep insertion order)
+                del self.__search_cache[next(iter(self.__search_cache))]
+            self.__search_cache[query] = result
+
+        self.__last_query = query
+        return result.copy()
+
+    def _search_all(self, query: str) -> List[Student]:
+        """
+        Search the whole collection for a non-empty, lower-case query.
+
+        Args:
+            query: Lower-cased text to search in name or ID.
+
+        Returns:
+            List of matching Student objects, in collection order.
+        """
+        if len(query) < 3:
+            return self._matching(self.__students, query)
+
+        # Intersect the smallest buckets first to keep the sets small
+        buckets = sorted(
+            (self.__trigrams.get(gram, set()) for gram in _trigrams(query)),
+            key=len,
+        )
+        candidates = buckets[0].intersection(*buckets[1:])
+        # Sharing all trigrams does not guarantee a substring match
+        matches = set(self._matching(candidates, query))
+        if not matches:
+            return []
+        if self.__sort_key is not None:
+            # Binary-search each match's position: O(k log N) for k matches
+            # instead of scanning the whole collection
+            return sorted(matches, key=self._index_of)
+        return [student for student in self.__students if student in matches]
+
+    @staticmethod
+    def _matching(students: Iterable[Student], query: str) -> List[Student]:
+        """
+        Return the students whose name or ID contains a lower-case query.
+
+        Args:
+            students: Students to filter.
+            query: Lower-cased text to search in name or ID.
+
+        Returns:
+            List of matching Student objects, in iteration order.
+        """
+        return [
+            student
+            for student in students
+            if query in student._name_lc or query in student._id_lc
+        ]
 
     def sort_students(self, by: str = "name", ascending: bool = True) -> None:
         """
         Sort the internal student list by a chosen field.
 
+        The list is kept in order between calls, so sorting again by the
+        current field is either a no-op or (when only the direction
+        changes) an O(N) reversal instead of a full sort.
+
         Args:
             by: Field to sort by, 'name' or 'id'.
             ascending: Sort ascending (True) or descending (False).
         """
+        key = _ID_SORT_KEY if by == "id" else _NAME_SORT_KEY
         reverse = not ascending
-
-        if by == "id":
-            self.__students.sort(
-                key=lambda s: s.get_student_id().lower(), reverse=reverse
-            )
+        if key is self.__sort_key:
+            if reverse == self.__sort_reverse:
+                return
+            self.__students.reverse()
         else:
-            self.__students.sort(
-                key=lambda s: s.get_name().lower(), reverse=reverse
-            )
+            self.__students.sort(key=key, reverse=reverse)
+        self.__sort_key = key
+        self.__sort_reverse = reverse
+        self.__search_cache.clear()
 
-        self.save_to_file()
+        self.__dirty = True
 
     # ---------------------------------------------------------------------
     # INTERNAL HELPERS
@@ -401,43 +762,407 @@ class StudentManager:
         """
         Private helper method to find a student by ID.
 
+        Uses the ID index, so the lookup is O(1) instead of a list scan.
+
         Args:
             student_id: The ID to search for.
 
         Returns:
             Student object if found, None otherwise.
         """
-        for student in self.__students:
-            if student.get_student_id() == student_id:
-                return student
-        return None
+        return self.__by_id.get(student_id)
+
+    def _index_student(self, student: Student) -> None:
+        """
+        Add a student's name and ID trigrams to the search index.
+        """
+        for gram in _trigrams(student._name_lc) | _trigrams(student._id_lc):
+            self.__trigrams.setdefault(gram, set()).add(student)
+
+    def _unindex_student(self, student: Student) -> None:
+        """
+        Remove a student's name and ID trigrams from the search index.
+
+        Must be called before the student's name or ID changes.
+        """
+        for gram in _trigrams(student._name_lc) | _trigrams(student._id_lc):
+            bucket = self.__trigrams[gram]
+            bucket.discard(student)
+            if not bucket:
+                del self.__trigrams[gram]
+
+    def _index_of(self, student: Student) -> int:
+        """
+        Return the list position of a student in the collection.
+
+        With an active sort order this is a binary search on the student's
+        sort key; otherwise it falls back to a list scan.
+
+        Args:
+            student: A Student that is in the collection.
+
+        Returns:
+            The student's index in the internal list.
+        """
+        students = self.__students
+        key = self.__sort_key
+        if key is None:
+            return students.index(student)
+
+        value = key(student)
+        if not self.__sort_reverse:
+            low = bisect.bisect_left(students, value, key=key)
+        else:
+            low, high = 0, len(students)
+            while low < high:
+                mid = (low + high) // 2
+                if key(students[mid]) > value:
+                    low = mid + 1
+                else:
+                    high = mid
+        # Several students can share a sort key; find this one among them
+        while students[low] is not student:
+            low += 1
+        return low
+
+    def _insert_in_order(self, student: Student) -> int:
+        """
+        Insert a student while keeping the active sort order.
+
+        Uses a binary search (O(log N) comparisons) instead of appending and
+        re-sorting. Without an active sort order the student is appended.
+
+        Args:
+            student: The Student to insert.
+
+        Returns:
+            The list index the student was inserted at.
+        """
+        students = self.__students
+        key = self.__sort_key
+        if key is None:
+            low = len(students)
+        elif not self.__sort_reverse:
+            low = bisect.bisect_right(students, key(student), key=key)
+        else:
+            # bisect only handles ascending order, so search manually.
+            # Equal keys go after existing ones, as a stable sort would.
+            value = key(student)
+            low, high = 0, len(students)
+            while low < high:
+                mid = (low + high) // 2
+                if value > key(students[mid]):
+                    high = mid
+                else:
+                    low = mid + 1
+        students.insert(low, student)
+        return low
 
     # ---------------------------------------------------------------------
     # FILE PERSISTENCE
     # ---------------------------------------------------------------------
-    def save_to_file(self) -> None:
+    def flush(self) -> None:
+        """
+        Save pending changes to disk, if there are any.
+        """
+        if self.__dirty:
+            self.save_to_file()
+
+    def compact(self) -> None:
+        """
+        Save pending changes, fold the append log into the data file and
+        wait until everything has been written.
+        """
+        if self.__dirty or self.__log_entries:
+            self.save_to_file()
+        self.wait_for_writes()
+
+    def wait_for_writes(self) -> None:
+        """
+        Block until all writes submitted so far have reached the disk.
+        """
+        if self.__last_write is not None:
+            self.__last_write.result()
+            self.__last_write = None
+
+    def _submit_write(self, func: Callable[..., None], *args: Any) -> None:
+        """
+        Queue a write function to run on the background writer thread.
         """
-        Save all students to a JSON file for persistence.
+        self.__last_write = self.__writer.submit(func, *args)
+
+    def _append_to_log(self, entry: Dict[str, Any]) -> None:
+        """
+        Append a single change to the JSON-Lines log.
+
+        Args:
+            entry: The change to record.
+        """
+        self.__log_entries += 1
+        self._submit_write(self._write_log_entry, _dumps(entry) + b"\n")
+
+        if self.__log_entries >= self.COMPACT_EVERY:
+            self.save_to_file()
+
+    def _write_log_entry(self, payload: bytes) -> None:
+        """
+        Append an encoded log line to the log file (writer thread).
+
+        Falls back to marking the collection dirty (so the next flush
+        writes a full snapshot) if the log cannot be written.
+        """
+        try:
+            with open(self.__log_file, "ab") as f:
+                f.write(payload)
+        except Exception as exc:
+            print(f"Error writing to log file: {exc}")
+            self.__dirty = True
+
+    def _replay_log(self) -> None:
+        """
+        Apply the changes recorded in the JSON-Lines log, if it exists.
+
+        A torn last line (e.g. after a crash mid-append) ends the replay, and
+        so does a line that parses but cannot be applied (e.g. a missing
+        field or invalid data): the changes before it are kept. The log is
+        then truncated after the last good line, so that new entries are
+        not appended behind the bad one (where they would never be read).
+        """
+        if not os.path.exists(self.__log_file):
+            return
+
+        with open(self.__log_file, "rb") as f:
+            buf = f.read()
+
+        # Byte offset just past the last line that was applied
+        good_end = 0
+        while good_end < len(buf):
+            line_end = buf.find(b"\n", good_end)
+            if line_end == -1:
+                line_end = len(buf)
+            try:
+                self._apply_log_entry(_loads(buf[good_end:line_end]))
+            except (ValueError, KeyError, TypeError, ValidationError) as exc:
+                print(f"Stopped replaying log file at a bad entry: {exc}")
+                break
+            self.__log_entries += 1
+            good_end = line_end + 1
+
+        if good_end > len(buf):
+            # The last entry is complete but lost its newline: restore it
+            with open(self.__log_file, "ab") as f:
+                f.write(b"\n")
+        elif good_end < len(buf):
+            with open(self.__log_file, "r+b") as f:
+                f.truncate(good_end)
+
+    def _apply_log_entry(self, entry: Dict[str, Any]) -> None:
+        """
+        Apply one logged change to the in-memory collection.
+
+        Entries that no longer apply (e.g. when the log outlived a snapshot
+        that already contains it after a crash) are skipped. The search
+        index is not updated here; load_from_file rebuilds it afterwards.
+
+        Args:
+            entry: A decoded log record.
+
+        Raises:
+            KeyError, TypeError, ValidationError: If the entry is malformed.
+                The collection is left unchanged in that case.
+        """
+        op = entry["op"]
+        if op == "add":
+            if entry["student_id"] not in self.__by_id:
+                student = Student.from_dict(entry)
+                index = entry.get("index", len(self.__students))
+                self.__students.insert(index, student)
+                self.__by_id[student.get_student_id()] = student
+        elif op == "update":
+            student = self.__by_id.get(entry["old_id"])
+            new_id = entry["student_id"]
+            if student is None or (
+                new_id != entry["old_id"] and new_id in self.__by_id
+            ):
+                return
+            # Validate all fields before changing anything, so a bad entry
+            # cannot leave the student half-updated
+            Student.from_dict(entry)
+            student.set_name(entry["name"])
+            student.set_id(new_id)
+            student.set_major(entry["major"])
+            del self.__by_id[entry["old_id"]]
+            self.__by_id[new_id] = student
+            if "index" in entry:
+                self.__students.remove(student)
+                self.__students.insert(entry["index"], student)
+        elif op == "delete":
+            student = self.__by_id.pop(entry["student_id"], None)
+            if student is not None:
+                self.__students.remove(student)
+
+    def save_to_file(self, pretty: bool = False) -> None:
+        """
+        Queue a save of all students to the JSON file for persistence.
+
+        The method returns as soon as the snapshot is taken; encoding and
+        writing happen on the writer thread, and a failure there is only
+        reported (and the collection marked dirty again). Call
+        wait_for_writes() or compact() when the data must be on disk
+        before continuing, as load_from_file and the GUI's close handler do.
+
+        The writer thread writes a temporary file first and then moves it
+        over the real file, so a crash mid-write never leaves a truncated
+        file.
+
+        Args:
+            pretty: Write indented JSON (e.g. for debugging) instead of the
+                default compact form.
+        """
+        # Same records as Student.to_dict, built inline to avoid a method
+        # call per student. The records are a private copy, so encoding them
+        # can safely happen on the writer thread.
+        data = [
+            {
+                "name": s._Person__name,
+                "student_id": s._Person__id,
+                "major": s._Student__major,
+            }
+            for s in self.__students
+        ]
+
+        self.__dirty = False
+        self.__log_entries = 0
+        self._submit_write(self._write_snapshot, data, pretty)
+
+    def _write_snapshot(self, data: List[Dict[str, str]], pretty: bool) -> None:
+        """
+        Encode a snapshot and atomically replace the data file with it
+        (writer thread), then drop the log it supersedes.
+
+        Args:
+            data: The records to write.
+            pretty: Write indented JSON instead of the compact form.
         """
         try:
-            data = [student.to_dict() for student in self.__students]
-            with open(self.__data_file, "w", encoding="utf-8") as f:
-                json.dump(data, f, indent=4, ensure_ascii=False)
+            payload = _dumps(data, pretty=pretty)
+            tmp_file = self.__data_file + ".tmp"
+            with open(tmp_file, "wb") as f:
+                f.write(payload)
+            os.replace(tmp_file, self.__data_file)
+            self._cache_records(data)
+
+            # Everything in the log is now part of the data file
+            if os.path.exists(self.__log_file):
+                os.remove(self.__log_file)
         except Exception as exc:
             print(f"Error saving to file: {exc}")
+            self.__dirty = True
+
+    def _file_signature(self) -> Tuple[int, int]:
+        """
+        Return the (mtime_ns, size) pair identifying the file's contents.
+        """
+        stat = os.stat(self.__data_file)
+        return stat.st_mtime_ns, stat.st_size
+
+    def _should_stream(self, size: int) -> bool:
+        """
+        Return True if a data file of the given size is stream-parsed.
+        """
+        return ijson is not None and size >= self.STREAM_THRESHOLD
+
+    def _cache_records(self, data: List[Dict[str, str]]) -> None:
+        """
+        Remember the records that are currently on disk.
+
+        Only small files are cached. For files of STREAM_THRESHOLD bytes or
+        more (stream-parsed when ijson is installed), a second copy of every
+        record would cost more memory than re-reading the file saves.
+
+        Args:
+            data: The records just written to or read from the data file.
+        """
+        path = os.path.abspath(self.__data_file)
+        signature = self._file_signature()
+        if signature[1] >= self.STREAM_THRESHOLD:
+            StudentManager.__records_cache.pop(path, None)
+        else:
+            StudentManager.__records_cache[path] = (signature, data)
+
+    def _stream_records(self) -> Iterator[Dict[str, str]]:
+        """
+        Yield the records of the data file one at a time, using ijson.
+        """
+        with open(self.__data_file, "rb") as f:
+            yield from ijson.items(f, "item")
+
+    def _read_records(self) -> Iterable[Dict[str, str]]:
+        """
+        Return the records stored in the data file.
+
+        The file is only read and parsed when it changed since it was last
+        loaded or saved in this process. The cached records are never
+        mutated (students are built from them), so they can be shared.
+        Large files are streamed instead of being parsed in one go.
+
+        Returns:
+            Iterable of student record dictionaries.
+        """
+        path = os.path.abspath(self.__data_file)
+        signature = self._file_signature()
+        cached = StudentManager.__records_cache.get(path)
+        if cached is not None and cached[0] == signature:
+            return cached[1]
+
+        if self._should_stream(signature[1]):
+            return self._stream_records()
+
+        with open(self.__data_file, "rb") as f:
+            data = _loads(f.read())
+        self._cache_records(data)
+        return data
 
     def load_from_file(self) -> None:
         """
         Load students from a JSON file, if it exists.
         """
+        # Don't read the files while a write to them is still queued
+        self.wait_for_writes()
         try:
             if os.path.exists(self.__data_file):
-                with open(self.__data_file, "r", encoding="utf-8") as f:
-                    data = json.load(f)
-                self.__students = [Student.from_dict(item) for item in data]
+                data = self._read_records()
+                students: List[Student] = []
+                by_id: Dict[str, Student] = {}
+                for item in data:
+                    student_id = str(item["student_id"])
+                    if student_id in by_id:
+                        # Keep the first record, as add_student would
+                        continue
+                    # Records on disk were written by save_to_file and are
+                    # already clean, so the fast constructor is safe here
+                    student = Student.from_dict_fast(item)
+                    students.append(student)
+                    by_id[student_id] = student
+                self.__students = students
+                self.__by_id = by_id
+                self.__sort_key = None
         except Exception as exc:
             print(f"Error loading from file: {exc}")
             self.__students = []
+            self.__by_id = {}
+
+        # A problem with the log must never discard the loaded snapshot
+        self.__log_entries = 0
+        try:
+            self._replay_log()
+        except OSError as exc:
+            print(f"Error reading log file: {exc}")
+
+        self.__trigrams = {}
+        for student in self.__students:
+            self._index_student(student)
+        self.__search_cache.clear()
 
 
 # ============================================================================
@@ -454,6 +1179,35 @@ class StudentApp:
     - ADVANCED TKINTER: Styles, Treeview, column sorting, Toplevel edit.
     """
 
+    # Delay used to coalesce bursts of changes into a single disk write.
+    SAVE_DELAY_MS: int = 500
+
+    # Delay after the last keystroke before a search-as-you-type runs.
+    SEARCH_DELAY_MS: int = 250
+
+    # Rows added to the table at a time; more are added while scrolling
+    RENDER_CHUNK: int = 200
+
+    # Rows above and below the viewport whose '#' number is kept current
+    NUMBER_MARGIN: int = 20
+
+    # Interval for checking whether the background data load has finished
+    LOAD_POLL_MS: int = 50
+
+    # How long a success message stays in the status bar
+    FLASH_MS: int = 2500
+
+    # Bindtag shared by the student input fields
+    INPUT_BINDTAG: str = "StudentInput"
+
+    # Table columns: (column id, heading, width, anchor, sort field or None)
+    COLUMNS: Tuple[Tuple[str, str, int, str, Optional[str]], ...] = (
+        ("num", "#", 50, tk.CENTER, None),
+        ("name", "Name", 200, tk.W, "name"),
+        ("sid", "Student ID (NIM)", 150, tk.CENTER, "id"),
+        ("major", "Major", 250, tk.W, None),
+    )
+
     def __init__(self, root: tk.Tk) -> None:
         """
         Initialize the GUI application.
@@ -471,8 +1225,38 @@ class StudentApp:
         self._current_sort_field: str = "name"
         self._current_sort_ascending: bool = True
 
+        # Pending debounced save (Tk "after" id)
+        self._save_after_id: Optional[str] = None
+
+        # Pending search-as-you-type (Tk "after" id)
+        self._search_after_id: Optional[str] = None
+
+        # Whether a table refresh is already queued for the next idle time
+        self._refresh_pending: bool = False
+
+        # Pending end of a status bar message (Tk "after" id)
+        self._flash_after_id: Optional[str] = None
+
+        # False while the window is minimized; refreshes wait until it is
+        # shown again
+        self._visible: bool = True
+
+        # What each Treeview row currently shows (row iid = student ID),
+        # in display order, so a refresh only touches rows that changed
+        self._last_rendered: Dict[str, Tuple[str, str, str]] = {}
+        self._row_order: List[str] = []
+
+        # Row number (and stripe) each row currently shows. Only rows near
+        # the viewport are renumbered, so other rows may be out of date.
+        self._row_numbers: Dict[str, int] = {}
+
+        # Students matching the current view, of which only the first
+        # _render_limit are in the Treeview (lazy population)
+        self._view_students: List[Student] = []
+        self._render_limit: int = self.RENDER_CHUNK
+
         # COMPOSITION: StudentApp "has-a" StudentManager
-        self.manager = StudentManager()
+        self.manager = StudentManager(autoload=False)
 
         # Configure modern styles
         self._configure_styles()
@@ -480,8 +1264,22 @@ class StudentApp:
         # Build the GUI
         self._create_widgets()
 
-        # Load and display existing students
-        self._refresh_student_list()
+        # Load existing students in the background so the window shows up
+        # (and stays responsive) even for a large data file
+        self._loading: bool = True
+        self._load_thread = threading.Thread(
+            target=self.manager.load_from_file, daemon=True
+        )
+        self._load_thread.start()
+        self.status_var.set("Loading students...")
+        self.root.after(self.LOAD_POLL_MS, self._check_load_done)
+
+        # Make sure pending changes are written before the window closes
+        self.root.protocol("WM_DELETE_WINDOW", self._on_close)
+
+        # Track whether the window is minimized
+        self.root.bind("<Map>", self._on_map, add="+")
+        self.root.bind("<Unmap>", self._on_unmap, add="+")
 
     # ------------------------------------------------------------------
     # STYLING
@@ -496,26 +1294,33 @@ class StudentApp:
         except tk.TclError:
             pass
 
+        # Named fonts are created once and shared by every style below, so
+        # Tk does not re-parse a font description for each widget
+        self._header_font = tkfont.Font(family="Segoe UI", size=18, weight="bold")
+        self._body_font = tkfont.Font(family="Segoe UI", size=10)
+        self._bold_font = tkfont.Font(family="Segoe UI", size=10, weight="bold")
+        self._status_font = tkfont.Font(family="Segoe UI", size=9)
+
         style.configure("TFrame", background="#f5f5fa")
         style.configure(
             "Header.TLabel",
             background="#f5f5fa",
-            font=("Segoe UI", 18, "bold"),
+            font=self._header_font,
             foreground="#333333",
         )
-        style.configure("TLabel", background="#f5f5fa", font=("Segoe UI", 10))
-        style.configure("TButton", font=("Segoe UI", 10, "bold"), padding=6)
+        style.configure("TLabel", background="#f5f5fa", font=self._body_font)
+        style.configure("TButton", font=self._bold_font, padding=6)
 
         style.configure(
             "Custom.Treeview",
-            font=("Segoe UI", 10),
+            font=self._body_font,
             rowheight=24,
             background="#ffffff",
             fieldbackground="#ffffff",
         )
         style.configure(
             "Custom.Treeview.Heading",
-            font=("Segoe UI", 10, "bold"),
+            font=self._bold_font,
             foreground="#ffffff",
             background="#4a6fa5",
         )
@@ -526,7 +1331,7 @@ class StudentApp:
         style.configure(
             "Status.TLabel",
             background="#e2e4f0",
-            font=("Segoe UI", 9),
+            font=self._status_font,
             anchor="w",
         )
 
@@ -557,23 +1362,42 @@ class StudentApp:
         ttk.Label(input_frame, text="Name:").grid(
             row=0, column=0, sticky=tk.W, pady=5
         )
-        self.name_entry = ttk.Entry(input_frame, width=40)
+        self.name_var = tk.StringVar()
+        self.name_entry = ttk.Entry(
+            input_frame, width=40, textvariable=self.name_var
+        )
         self.name_entry.grid(row=0, column=1, padx=10, pady=5, sticky=tk.EW)
 
         ttk.Label(input_frame, text="Student ID (NIM):").grid(
             row=1, column=0, sticky=tk.W, pady=5
         )
-        self.id_entry = ttk.Entry(input_frame, width=40)
+        self.id_var = tk.StringVar()
+        self.id_entry = ttk.Entry(
+            input_frame, width=40, textvariable=self.id_var
+        )
         self.id_entry.grid(row=1, column=1, padx=10, pady=5, sticky=tk.EW)
 
         ttk.Label(input_frame, text="Major:").grid(
             row=2, column=0, sticky=tk.W, pady=5
         )
-        self.major_entry = ttk.Entry(input_frame, width=40)
+        self.major_var = tk.StringVar()
+        self.major_entry = ttk.Entry(
+            input_frame, width=40, textvariable=self.major_var
+        )
         self.major_entry.grid(row=2, column=1, padx=10, pady=5, sticky=tk.EW)
 
         input_frame.columnconfigure(1, weight=1)
 
+        # Return in any input field adds the student. The binding lives on a
+        # shared bindtag, registered once, rather than on each entry; a
+        # plain TEntry class binding would also fire in the search field.
+        self.root.bind_class(
+            self.INPUT_BINDTAG, "<Return>", lambda event: self._add_student()
+        )
+        for entry in (self.name_entry, self.id_entry, self.major_entry):
+            tags = entry.bindtags()
+            entry.bindtags((tags[0], self.INPUT_BINDTAG, *tags[1:]))
+
         # BUTTON SECTION
         button_frame = ttk.Frame(self.root, padding="10")
         button_frame.pack(fill=tk.X, padx=10)
@@ -620,6 +1444,7 @@ class StudentApp:
         self.search_entry = ttk.Entry(search_frame, width=40)
         self.search_entry.pack(side=tk.LEFT, padx=5)
         self.search_entry.bind("<Return>", lambda event: self._perform_search())
+        self.search_entry.bind("<KeyRelease>", self._on_search_key)
 
         search_btn = ttk.Button(
             search_frame,
@@ -641,38 +1466,35 @@ class StudentApp:
         table_frame = ttk.LabelFrame(self.root, text="Student List", padding="10")
         table_frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
 
-        columns = ("ID", "Name", "Student ID", "Major")
         self.tree = ttk.Treeview(
             table_frame,
-            columns=columns,
+            columns=[column[0] for column in self.COLUMNS],
             show="headings",
             height=15,
             style="Custom.Treeview",
         )
 
-        self.tree.heading("ID", text="#")
-        self.tree.heading(
-            "Name", text="Name", command=lambda: self._on_column_click("name")
-        )
-        self.tree.heading(
-            "Student ID",
-            text="Student ID (NIM)",
-            command=lambda: self._on_column_click("id"),
-        )
-        self.tree.heading("Major", text="Major")
-
-        self.tree.column("ID", width=50, anchor=tk.CENTER)
-        self.tree.column("Name", width=200, anchor=tk.W)
-        self.tree.column("Student ID", width=150, anchor=tk.CENTER)
-        self.tree.column("Major", width=250, anchor=tk.W)
+        for column_id, heading, width, anchor, sort_field in self.COLUMNS:
+            if sort_field is None:
+                self.tree.heading(column_id, text=heading)
+            else:
+                self.tree.heading(
+                    column_id,
+                    text=heading,
+                    command=lambda field=sort_field: self._on_column_click(field),
+                )
+            self.tree.column(column_id, width=width, anchor=anchor)
 
-        scrollbar = ttk.Scrollbar(
+        self.scrollbar = ttk.Scrollbar(
             table_frame, orient=tk.VERTICAL, command=self.tree.yview
         )
-        self.tree.configure(yscrollcommand=scrollbar.set)
+        self.tree.configure(yscrollcommand=self._on_tree_yscroll)
+        # Tcl name of the registered callback, so the refresh can detach and
+        # re-attach it without registering a new Tcl command each time
+        self._yscroll_command: str = str(self.tree.cget("yscrollcommand"))
 
         self.tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
-        scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        self.scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
 
         # Row striping
         self.tree.tag_configure("oddrow", background="#f7f8ff")
@@ -697,9 +1519,12 @@ class StudentApp:
         """
         Handle the "Add Student" button click event.
         """
-        name = self.name_entry.get()
-        student_id = self.id_entry.get()
-        major = self.major_entry.get()
+        if not self._ensure_loaded():
+            return
+
+        name = self.name_var.get()
+        student_id = self.id_var.get()
+        major = self.major_var.get()
 
         if not name or not student_id or not major:
             messagebox.showwarning(
@@ -708,22 +1533,21 @@ class StudentApp:
             )
             return
 
-        if self.manager.add_student(name, student_id, major):
-            messagebox.showinfo(
-                "Success", f"Student '{name}' has been added successfully!"
-            )
+        result = self.manager.add_student(name, student_id, major)
+        if result is AddResult.OK:
+            self._flash_status(f"Student '{name}' has been added successfully!")
             self._clear_fields()
-            self._refresh_student_list()
+            self._schedule_refresh()
+            self._schedule_save()
+        elif result is AddResult.DUPLICATE:
+            messagebox.showerror(
+                "Error",
+                f"Student ID '{student_id}' already exists. Please use a unique ID.",
+            )
         else:
-            if self.manager._find_student_by_id(student_id):
-                messagebox.showerror(
-                    "Error",
-                    f"Student ID '{student_id}' already exists. Please use a unique ID.",
-                )
-            else:
-                messagebox.showerror(
-                    "Error", "Failed to add student. Please check your input."
-                )
+            messagebox.showerror(
+                "Error", "Failed to add student. Please check your input."
+            )
 
     def _delete_student(self) -> None:
         """
@@ -737,9 +1561,13 @@ class StudentApp:
             )
             return
 
-        item_values = self.tree.item(selected_item[0], "values")
-        student_id = item_values[2]
-        student_name = item_values[1]
+        # Rows are keyed by student ID, so the selection is the ID itself
+        student_id = selected_item[0]
+        student = self.manager.get_student(student_id)
+        if student is None:
+            messagebox.showerror("Error", "Failed to delete student.")
+            return
+        student_name = student.get_name()
 
         confirm = messagebox.askyesno(
             "Confirm Deletion",
@@ -748,10 +1576,9 @@ class StudentApp:
 
         if confirm:
             if self.manager.delete_student(student_id):
-                messagebox.showinfo(
-                    "Success", f"Student '{student_name}' has been deleted."
-                )
-                self._refresh_student_list()
+                self._flash_status(f"Student '{student_name}' has been deleted.")
+                self._schedule_refresh()
+                self._schedule_save()
             else:
                 messagebox.showerror("Error", "Failed to delete student.")
 
@@ -759,25 +1586,59 @@ class StudentApp:
         """
         Clear all input fields and refocus on the name entry.
         """
-        self.name_entry.delete(0, tk.END)
-        self.id_entry.delete(0, tk.END)
-        self.major_entry.delete(0, tk.END)
+        self.name_var.set("")
+        self.id_var.set("")
+        self.major_var.set("")
         self.name_entry.focus()
 
+    def _on_search_key(self, event: tk.Event) -> None:
+        """
+        Handle typing in the search entry (search-as-you-type).
+
+        The search is debounced: each keystroke restarts a short timer, so
+        a burst of typing results in a single search and table refresh.
+        """
+        if event.keysym == "Return":
+            # Already handled immediately by the <Return> binding
+            return
+        self._cancel_pending_search()
+        self._search_after_id = self.root.after(
+            self.SEARCH_DELAY_MS, self._perform_search
+        )
+
+    def _cancel_pending_search(self) -> None:
+        """
+        Cancel a scheduled search-as-you-type, if any.
+        """
+        if self._search_after_id is not None:
+            self.root.after_cancel(self._search_after_id)
+            self._search_after_id = None
+
     def _perform_search(self) -> None:
         """
         Trigger a search based on the text in the search entry.
         """
-        self._current_search_query = self.search_entry.get().strip()
-        self._refresh_student_list()
+        self._cancel_pending_search()
+        query = self.search_entry.get().strip()
+        if query == self._current_search_query:
+            # e.g. Tab, Shift or arrow keys: keep the rows rendered so far
+            return
+        self._current_search_query = query
+        self._render_limit = self.RENDER_CHUNK
+        self._schedule_refresh()
 
     def _reset_search(self) -> None:
         """
         Clear the search query and show all students again.
         """
-        self._current_search_query = ""
+        self._cancel_pending_search()
         self.search_entry.delete(0, tk.END)
-        self._refresh_student_list()
+        if not self._current_search_query:
+            # Already showing all students
+            return
+        self._current_search_query = ""
+        self._render_limit = self.RENDER_CHUNK
+        self._schedule_refresh()
 
     def _on_column_click(self, field: str) -> None:
         """
@@ -786,6 +1647,9 @@ class StudentApp:
         Args:
             field: 'name' or 'id', identifying the sort key.
         """
+        if not self._ensure_loaded():
+            return
+
         if self._current_sort_field == field:
             self._current_sort_ascending = not self._current_sort_ascending
         else:
@@ -795,7 +1659,8 @@ class StudentApp:
         self.manager.sort_students(
             by=self._current_sort_field, ascending=self._current_sort_ascending
         )
-        self._refresh_student_list()
+        self._schedule_refresh()
+        self._schedule_save()
 
     def _open_edit_window(self) -> None:
         """
@@ -808,10 +1673,11 @@ class StudentApp:
             )
             return
 
-        item_values = self.tree.item(selected_item[0], "values")
-        current_id = item_values[2]
-        current_name = item_values[1]
-        current_major = item_values[3]
+        # Rows are keyed by student ID, so the selection is the ID itself
+        student = self.manager.get_student(selected_item[0])
+        if student is None:
+            return
+        current_name, current_id, current_major = student.as_row()
 
         edit_window = tk.Toplevel(self.root)
         edit_window.title("Edit Student")
@@ -861,13 +1727,12 @@ class StudentApp:
             )
 
             if success:
-                messagebox.showinfo(
-                    "Success",
-                    f"Student '{new_name}' has been updated successfully.",
-                    parent=edit_window,
-                )
                 edit_window.destroy()
-                self._refresh_student_list()
+                self._flash_status(
+                    f"Student '{new_name}' has been updated successfully."
+                )
+                self._schedule_refresh()
+                self._schedule_save()
             else:
                 messagebox.showerror(
                     "Error",
@@ -900,42 +1765,291 @@ class StudentApp:
         y_coord = int((screen_height / 2) - (height / 2))
         window.geometry(f"{width}x{height}+{x_coord}+{y_coord}")
 
+    # ------------------------------------------------------------------
+    # BACKGROUND LOADING
+    # ------------------------------------------------------------------
+    def _check_load_done(self) -> None:
+        """
+        Poll the background load; display the students once it finishes.
+        """
+        if self._load_thread.is_alive():
+            self.root.after(self.LOAD_POLL_MS, self._check_load_done)
+            return
+        self._loading = False
+        self._schedule_refresh()
+
+    def _ensure_loaded(self) -> bool:
+        """
+        Return True if the data is loaded; otherwise ask the user to wait.
+        """
+        if self._loading:
+            messagebox.showinfo("Please Wait", "Student data is still loading.")
+            return False
+        return True
+
+    # ------------------------------------------------------------------
+    # PERSISTENCE
+    # ------------------------------------------------------------------
+    def _schedule_save(self) -> None:
+        """
+        Schedule a debounced save, replacing any save already pending.
+        """
+        if self._save_after_id is not None:
+            self.root.after_cancel(self._save_after_id)
+        self._save_after_id = self.root.after(
+            self.SAVE_DELAY_MS, self._save_pending_changes
+        )
+
+    def _save_pending_changes(self) -> None:
+        """
+        Write the manager's pending changes to disk.
+        """
+        self._save_after_id = None
+        self.manager.flush()
+
+    def _on_close(self) -> None:
+        """
+        Handle the window close event: flush pending changes, then exit.
+        """
+        if self._loading:
+            # Nothing can have changed yet, and the manager is only
+            # partially loaded: don't write it back
+            self.root.destroy()
+            return
+
+        if self._save_after_id is not None:
+            self.root.after_cancel(self._save_after_id)
+            self._save_after_id = None
+        self.manager.compact()
+        self.root.destroy()
+
     # ------------------------------------------------------------------
     # DATA BINDING / STATUS
     # ------------------------------------------------------------------
+    def _schedule_refresh(self) -> None:
+        """
+        Queue a table refresh for when the event loop is next idle.
+
+        Several changes made while handling one event (or a bulk operation)
+        then cost a single refresh instead of one each. While the window is
+        minimized the refresh is only marked as pending and runs when the
+        window is shown again.
+        """
+        if not self._refresh_pending:
+            self._refresh_pending = True
+            if self._visible:
+                self.root.after_idle(self._do_refresh)
+
+    def _do_refresh(self) -> None:
+        """
+        Run the refresh queued by _schedule_refresh.
+        """
+        if not self._refresh_pending or not self._visible:
+            # Already done, or deferred until the window is shown again
+            return
+        self._refresh_pending = False
+        self._refresh_student_list()
+
+    def _on_map(self, event: tk.Event) -> None:
+        """
+        Handle the window being shown: run a refresh deferred while hidden.
+        """
+        # Bindings on the root window also receive its children's events
+        if event.widget is not self.root:
+            return
+        self._visible = True
+        if self._refresh_pending:
+            self.root.after_idle(self._do_refresh)
+
+    def _on_unmap(self, event: tk.Event) -> None:
+        """
+        Handle the window being minimized: defer refreshes from now on.
+        """
+        if event.widget is self.root:
+            self._visible = False
+
     def _refresh_student_list(self) -> None:
         """
         Refresh the Treeview table with current student data.
         """
-        for item in self.tree.get_children():
-            self.tree.delete(item)
+        if self._loading:
+            # _check_load_done refreshes once the data is available
+            return
 
         if self._current_search_query:
             students = self.manager.search_students(self._current_search_query)
         else:
             students = self.manager.get_all_students()
 
-        for index, student in enumerate(students, start=1):
-            tag = "evenrow" if index % 2 == 0 else "oddrow"
-            self.tree.insert(
-                "",
-                tk.END,
-                values=(
-                    index,
-                    student.get_name(),
-                    student.get_student_id(),
-                    student.get_major(),
-                ),
-                tags=(tag,),
-            )
+        self._view_students = students
+        self._render_rows()
+        self._update_status_bar(total=self.manager.count())
+
+    def _on_tree_yscroll(self, first: str, last: str) -> None:
+        """
+        Forward Treeview scrolling to the scrollbar, number the rows that
+        came into view and, when the bottom of the rendered rows comes into
+        view, render the next chunk.
+        """
+        self.scrollbar.set(first, last)
+        self._number_visible_rows()
+        if float(last) >= 0.9 and self._render_limit < len(self._view_students):
+            self._render_limit += self.RENDER_CHUNK
+            self._render_rows()
 
-        self._update_status_bar(total=len(self.manager.get_all_students()))
+    def _render_rows(self) -> None:
+        """
+        Bring the Treeview in line with the first _render_limit students of
+        the current view.
+
+        Rows are keyed by student ID and diffed against what is currently
+        displayed: only rows that disappeared are deleted, only new rows
+        are inserted and only changed rows are updated. The final order is
+        then applied in a single call if it differs. Rows beyond the limit
+        are only inserted once the user scrolls towards them.
+
+        The '#' number and stripe depend on a row's position, so adding or
+        removing one student would shift every row below it. They are
+        therefore only rewritten for rows near the viewport (see
+        _number_visible_rows).
+        """
+        students = self._view_students[: self._render_limit]
+
+        # map() with an attrgetter builds every row tuple in C, without a
+        # Python-level call per student
+        rendered: Dict[str, Tuple[str, str, str]] = {
+            row[1]: row for row in map(_ROW_FIELDS, students)
+        }
+
+        # Bind the per-row lookups once, outside the hot loops
+        tree = self.tree
+        # Positional Tcl call: skips Treeview.insert's keyword processing
+        tk_call = tree.tk.call
+        widget = str(tree)
+        update_item = tree.item
+        set_cell = tree.set
+        column_ids = [column[0] for column in self.COLUMNS]
+        previous_rows = self._last_rendered
+        get_previous = previous_rows.get
+        numbers = self._row_numbers
+
+        # The Treeview's children are exactly the previously rendered rows,
+        # in order, so the current order is known without asking Tk for it
+        kept: List[str] = []
+        stale: List[str] = []
+        for iid in previous_rows:
+            (kept if iid in rendered else stale).append(iid)
+        inserted: List[str] = []
+
+        # Detach the scrollbar while rows change, so it is not recomputed
+        # after every single insert/delete, and sync it once at the end
+        tree.configure(yscrollcommand="")
+        try:
+            if stale:
+                tree.delete(*stale)
+                for iid in stale:
+                    del numbers[iid]
+
+            for number, (iid, row) in enumerate(rendered.items(), start=1):
+                previous = get_previous(iid)
+                if previous is None:
+                    tk_call(
+                        widget,
+                        "insert",
+                        "",
+                        "end",
+                        "-id",
+                        iid,
+                        "-values",
+                        (number, *row),
+                        "-tags",
+                        ROW_TAGS[number & 1],
+                    )
+                    numbers[iid] = number
+                    inserted.append(iid)
+                elif previous != row:
+                    changed = [
+                        column
+                        for column, (old, new) in enumerate(zip(previous, row))
+                        if old != new
+                    ]
+                    if len(changed) == 1:
+                        # A single edited cell: update just that cell (the
+                        # first table column is the row number)
+                        column = changed[0]
+                        set_cell(iid, column_ids[column + 1], row[column])
+                    else:
+                        update_item(iid, values=(numbers[iid], *row))
+
+            # New rows were appended after the surviving ones
+            order = list(rendered)
+            if kept + inserted != order:
+                tree.set_children("", *order)
+        finally:
+            tree.configure(yscrollcommand=self._yscroll_command)
+            self.scrollbar.set(*tree.yview())
+
+        self._last_rendered = rendered
+        self._row_order = order
+        self._number_visible_rows()
+
+    def _number_visible_rows(self) -> None:
+        """
+        Bring the '#' number and stripe of the rows in (and NUMBER_MARGIN
+        rows around) the viewport in line with their position.
+
+        Called after every render and whenever the table scrolls, so the
+        rows the user can see are always numbered correctly.
+        """
+        order = self._row_order
+        if not order:
+            return
+
+        first, last = self.tree.yview()
+        count = len(order)
+        start = max(int(float(first) * count) - self.NUMBER_MARGIN, 0)
+        stop = min(int(float(last) * count) + self.NUMBER_MARGIN + 1, count)
+
+        rows = self._last_rendered
+        numbers = self._row_numbers
+        update_item = self.tree.item
+        for number, iid in enumerate(order[start:stop], start=start + 1):
+            if numbers[iid] != number:
+                update_item(
+                    iid, values=(number, *rows[iid]), tags=(ROW_TAGS[number & 1],)
+                )
+                numbers[iid] = number
 
     def _update_status_bar(self, total: int) -> None:
         """
         Update the status bar with total students information.
+
+        While a message from _flash_status is showing, the total is shown
+        once the message expires instead.
+        """
+        if self._flash_after_id is None:
+            self.status_var.set(f"Total Students: {total}")
+
+    def _flash_status(self, message: str) -> None:
+        """
+        Show a short-lived message in the status bar.
+
+        Used for success notifications instead of a modal dialog.
+
+        Args:
+            message: Text to show for FLASH_MS milliseconds.
+        """
+        if self._flash_after_id is not None:
+            self.root.after_cancel(self._flash_after_id)
+        self.status_var.set(message)
+        self._flash_after_id = self.root.after(self.FLASH_MS, self._end_flash)
+
+    def _end_flash(self) -> None:
+        """
+        Replace an expired status bar message with the student total.
         """
-        self.status_var.set(f"Total Students: {total}")
+        self._flash_after_id = None
+        self._update_status_bar(total=self.manager.count())
 
 
 # ============================================================================